@@ -0,0 +1,2 @@
+# load_test.py correspond au motif *_test.py de pytest mais n'est pas un module de tests
+collect_ignore = ["load_test.py"]
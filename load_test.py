@@ -0,0 +1,600 @@
+"""Banc de test de charge pour Excel Data Manager Pro.
+
+Simule plusieurs sessions Streamlit concurrentes à l'aide de
+``streamlit.testing.v1.AppTest`` : chaque session parcourt un scénario réaliste
+(navigation, recherche, ajout, mise à jour, suppression et export) sur la vraie
+base MySQL. Le rapport indique le débit, les percentiles de latence, le nombre
+de connexions à la base et la mémoire consommée par session.
+
+Chaque session s'exécute dans un processus dédié : AppTest modifie des états
+globaux de Streamlit (runtime, secrets) et ne peut donc pas être partagé entre
+threads. Conséquence : le cache ``st.cache_data`` n'est partagé qu'entre les
+sessions d'un même processus, et ``st.cache_data.clear()`` après une écriture
+n'invalide que ce processus. La base reçoit donc plus de requêtes qu'avec un
+serveur unique : les chiffres obtenus sont une borne haute.
+
+Les identifiants de connexion sont lus dans ``.streamlit/secrets.toml`` comme
+pour l'application : lancer le script depuis la racine du projet.
+
+Exemples :
+    python load_test.py --sessions 20 --concurrency 5
+    python load_test.py --sessions 10 --scenario complet --allow-writes
+    python load_test.py --sessions 10 --json rapport.json --max-p95-ms 2000
+"""
+import argparse
+import json
+import multiprocessing as mp
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import mysql.connector
+import numpy as np
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+APP_PATH = Path(__file__).resolve().parent / "app.py"
+EMAIL_PREFIX = "loadtest-"
+# Attente maximale (s) des autres processus après le préchauffage
+READY_TIMEOUT = 120
+
+# Compteurs et instant de départ partagés entre les processus (initialisés par _init_worker)
+_shared: Dict[str, Any] = {}
+# Compteur local au processus, pour attribuer les connexions à chaque étape
+_local_connections = {"opened": 0}
+
+
+# Instrumentation des connexions MySQL
+class InstrumentedConnection:
+    """Enveloppe une connexion MySQL pour suivre les connexions ouvertes"""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self._closed = False
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            with _shared["lock"]:
+                _shared["open"].value -= 1
+        return self._conn.close()
+
+
+def _instrumented_connect(original_connect: Callable) -> Callable:
+    def connect(*args, **kwargs):
+        try:
+            conn = original_connect(*args, **kwargs)
+        except mysql.connector.Error:
+            with _shared["lock"]:
+                _shared["failed"].value += 1
+            raise
+        _local_connections["opened"] += 1
+        with _shared["lock"]:
+            _shared["opened"].value += 1
+            _shared["open"].value += 1
+            _shared["peak"].value = max(_shared["peak"].value, _shared["open"].value)
+        return InstrumentedConnection(conn)
+    return connect
+
+
+def _init_worker(lock, opened, failed, open_now, peak, ready, barrier, timeout):
+    """Initialiser un processus de travail : préchauffage, compteurs et instrumentation"""
+    # Une exécution à blanc charge les modules de l'application (plotly, pandas...)
+    # pour que la mémoire mesurée par session n'inclue pas ce coût d'import
+    try:
+        AppTest.from_file(str(APP_PATH), default_timeout=timeout).run()
+    except Exception:
+        pass  # l'erreur sera rapportée par la première session
+    st.cache_data.clear()
+
+    _shared.update(lock=lock, opened=opened, failed=failed, open=open_now, peak=peak, ready=ready)
+    mysql.connector.connect = _instrumented_connect(mysql.connector.connect)
+
+    # Attendre que tous les processus soient prêts : les départs des sessions
+    # (--ramp-up) sont calculés à partir de cet instant
+    try:
+        barrier.wait(READY_TIMEOUT)
+    except threading.BrokenBarrierError:
+        pass  # processus remplacé ou préchauffage trop long : démarrer sans attendre
+    with lock:
+        if ready.value == 0:
+            ready.value = time.time()
+
+
+# Mesure de la mémoire
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss est en octets sous macOS, en kilo-octets sous Linux
+    return maxrss / 1024 ** 2 if sys.platform == "darwin" else maxrss / 1024
+
+
+def _current_rss_mb() -> Optional[float]:
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+    except (OSError, ValueError, AttributeError):
+        return _peak_rss_mb()
+
+
+# Interactions avec l'application
+def _widget(widgets, label: str):
+    for widget in widgets:
+        if widget.label == label:
+            return widget
+    raise LookupError(f"Widget introuvable : {label}")
+
+
+def _target_session_employee(at, session: Dict[str, Any], select_label: str):
+    """Filtrer la liste sur l'employé créé par la session et le sélectionner.
+
+    Refuse d'agir si le filtre ne renvoie pas exactement cet employé, pour ne
+    jamais modifier ou supprimer des données réelles.
+    """
+    search = _widget(at.sidebar.text_input, "🔎 Recherche globale")
+    if search.value != session["email"]:
+        search.input(session["email"])
+        _widget(at.sidebar.selectbox, "🏢 Département").select("Tous")
+        _widget(at.sidebar.selectbox, "🌍 Pays").select("Tous")
+        at.run()
+    selectbox = _widget(at.selectbox, select_label)
+    if len(selectbox.options) != 1 or session["nom"] not in selectbox.options[0]:
+        raise RuntimeError(f"Employé de test introuvable : {session['email']}")
+    return selectbox
+
+
+def step_open(session):
+    session["at"] = AppTest.from_file(str(APP_PATH), default_timeout=session["timeout"])
+    session["at"].run()
+
+
+def step_browse(session):
+    at = session["at"]
+    rng = session["rng"]
+    _widget(at.selectbox, "Employés par page").select(rng.choice([10, 25, 50, 100]))
+    _widget(at.selectbox, "Trier par").select(rng.choice(['Nom', 'Salaire', 'Département', 'Pays']))
+    _widget(at.checkbox, "Croissant").set_value(rng.random() < 0.5)
+    at.run()
+
+
+def step_paginate(session):
+    at = session["at"]
+    pages = [w for w in at.number_input if w.label == "Page"]
+    if pages:
+        pages[0].set_value(session["rng"].randint(int(pages[0].min), int(pages[0].max)))
+    at.run()
+
+
+def step_search(session):
+    at = session["at"]
+    departments = _widget(at.sidebar.selectbox, "🏢 Département").options[1:]
+    term = session["rng"].choice(departments)[:3] if departments else "a"
+    _widget(at.sidebar.text_input, "🔎 Recherche globale").input(term)
+    at.run()
+
+
+def step_filter(session):
+    at = session["at"]
+    countries = _widget(at.sidebar.selectbox, "🌍 Pays")
+    countries.select_index(session["rng"].randrange(len(countries.options)))
+    at.run()
+
+
+def step_add(session):
+    at = session["at"]
+    _widget(at.text_input, "👤 Nom complet *").input(session["nom"])
+    _widget(at.text_input, "📧 Email *").input(session["email"])
+    _widget(at.text_input, "📱 Téléphone *").input("+241 60 00 00 00")
+    _widget(at.text_input, "🏢 Département *").input("Load Test")
+    _widget(at.text_input, "💼 Poste *").input("Load Test")
+    _widget(at.text_input, "🌍 Pays *").input("Load Test")
+    _widget(at.button, "➕ Ajouter l'Employé").click()
+    at.run()
+
+
+def step_update(session):
+    at = session["at"]
+    _target_session_employee(at, session, "Sélectionner un employé")
+    _widget(at.text_input, "Poste").input("Load Test (modifié)")
+    _widget(at.button, "💾 Mettre à jour").click()
+    at.run()
+
+
+def step_delete(session):
+    at = session["at"]
+    _target_session_employee(at, session, "Sélectionner un employé à supprimer")
+    _widget(at.checkbox, "Je confirme vouloir supprimer cet employé").check()
+    _widget(at.button, "🗑️ Supprimer").click()
+    at.run()
+    # AppTest conserve les widgets du formulaire de l'employé supprimé après
+    # st.rerun : recharger la page (mesurée comme une étape « recharger »)
+    session["reload"] = not (at.exception or at.error)
+
+
+def step_export(session):
+    at = session["at"]
+    at.run()
+    if not at.get("download_button"):
+        raise RuntimeError("Bouton d'export CSV absent")
+
+
+STEPS: Dict[str, Callable] = {
+    "ouvrir": step_open,
+    # Rechargement à cache chaud, distinct de la première ouverture
+    "recharger": step_open,
+    "parcourir": step_browse,
+    "paginer": step_paginate,
+    "rechercher": step_search,
+    "filtrer": step_filter,
+    "ajouter": step_add,
+    "modifier": step_update,
+    "supprimer": step_delete,
+    "exporter": step_export,
+}
+
+SCENARIOS = {
+    "complet": ["ouvrir", "parcourir", "paginer", "rechercher", "filtrer",
+                "ajouter", "modifier", "supprimer", "exporter"],
+    "lecture": ["ouvrir", "parcourir", "paginer", "rechercher", "filtrer", "exporter"],
+}
+# Étapes qui écrivent dans la base : à autoriser explicitement avec --allow-writes
+WRITE_STEPS = ("ajouter", "modifier", "supprimer")
+
+
+# Exécution d'une session
+def _run_step(name: str, session: Dict[str, Any]) -> Dict[str, Any]:
+    opened_before = _local_connections["opened"]
+    start = time.perf_counter()
+    error = None
+    try:
+        STEPS[name](session)
+        at = session["at"]
+        if at.exception:
+            error = at.exception[0].value
+        elif at.error:
+            error = at.error[0].value
+    except Exception as e:
+        error = f"{type(e).__name__}: {str(e)}"
+    return {
+        "step": name,
+        "latency": time.perf_counter() - start,
+        "connections": _local_connections["opened"] - opened_before,
+        "error": error,
+    }
+
+
+def run_session(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Exécuter un scénario complet pour une session simulée"""
+    delay = _shared["ready"].value + job["start_offset"] - time.time()
+    if delay > 0:
+        time.sleep(delay)
+
+    session = {
+        "rng": random.Random(job["seed"]),
+        "nom": f"Load Test {job['run_id']}-{job['index']}",
+        "email": f"{EMAIL_PREFIX}{job['run_id']}-{job['index']}@example.com",
+        "timeout": job["timeout"],
+    }
+    rss_before = _current_rss_mb()
+    opened_before = _local_connections["opened"]
+    started_at = time.time()
+    start = time.perf_counter()
+
+    steps = []
+    for name in job["steps"]:
+        steps.append(_run_step(name, session))
+        if session.pop("reload", False):
+            steps.append(_run_step("recharger", session))
+        # Une session dont la page ne s'ouvre pas ne peut pas poursuivre son scénario
+        if steps[-1]["step"] in ("ouvrir", "recharger") and steps[-1]["error"]:
+            break
+        if job["think_time"] > 0:
+            time.sleep(session["rng"].uniform(0, job["think_time"]))
+
+    rss_after = _current_rss_mb()
+    return {
+        "index": job["index"],
+        "pid": os.getpid(),
+        "started_at": started_at,
+        "ended_at": time.time(),
+        "duration": time.perf_counter() - start,
+        "connections": _local_connections["opened"] - opened_before,
+        "rss_growth_mb": None if rss_before is None else rss_after - rss_before,
+        "peak_rss_mb": _peak_rss_mb(),
+        "steps": steps,
+    }
+
+
+def cleanup_test_data(run_id: str) -> int:
+    """Supprimer les employés de test laissés par une session interrompue"""
+    conn = None
+    cursor = None
+    try:
+        conn = mysql.connector.connect(
+            host=st.secrets["db_host"],
+            user=st.secrets["db_user"],
+            password=st.secrets["db_password"],
+            database=st.secrets["db_name"],
+            autocommit=True,
+            connection_timeout=10
+        )
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM employees_codon WHERE Email LIKE %s",
+                       (f"{EMAIL_PREFIX}{run_id}-%",))
+        return cursor.rowcount
+    finally:
+        if cursor:
+            cursor.close()
+        if conn and conn.is_connected():
+            conn.close()
+
+
+# Rapport
+def _percentiles(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {}
+    ms = np.array(values) * 1000
+    return {
+        "p50": float(np.percentile(ms, 50)),
+        "p90": float(np.percentile(ms, 90)),
+        "p95": float(np.percentile(ms, 95)),
+        "p99": float(np.percentile(ms, 99)),
+        "max": float(ms.max()),
+    }
+
+
+def build_report(sessions: List[Dict[str, Any]], wall_time: float,
+                 counters: Dict[str, int], config: Dict[str, Any]) -> Dict[str, Any]:
+    all_steps = [s for session in sessions for s in session["steps"]]
+    errors = [s for s in all_steps if s["error"]]
+    # Les étapes en échec (souvent très rapides) fausseraient latences et débit :
+    # elles ne comptent que dans le taux d'erreur
+    succeeded = [s for s in all_steps if not s["error"]]
+    completed = [session for session in sessions
+                 if not any(s["error"] for s in session["steps"])]
+
+    per_step = {}
+    # Étapes du scénario, puis celles ajoutées en cours de route (« recharger »)
+    for name in dict.fromkeys(config["steps"] + [s["step"] for s in all_steps]):
+        steps = [s for s in all_steps if s["step"] == name]
+        if not steps:
+            continue
+        per_step[name] = {
+            "count": len(steps),
+            "errors": sum(1 for s in steps if s["error"]),
+            "avg_connections": sum(s["connections"] for s in steps) / len(steps),
+            "latency_ms": _percentiles([s["latency"] for s in steps if not s["error"]]),
+        }
+
+    rss_growth = [s["rss_growth_mb"] for s in sessions if s["rss_growth_mb"] is not None]
+    peak_rss = [s["peak_rss_mb"] for s in sessions if s["peak_rss_mb"] is not None]
+
+    return {
+        "config": config,
+        "wall_time_s": wall_time,
+        "sessions": len(sessions),
+        "steps": len(all_steps),
+        "throughput": {
+            "steps_per_s": len(succeeded) / wall_time if wall_time else 0.0,
+            "sessions_per_min": len(completed) * 60 / wall_time if wall_time else 0.0,
+        },
+        "errors": {
+            "count": len(errors),
+            "rate": len(errors) / len(all_steps) if all_steps else 0.0,
+            "samples": sorted({f"{s['step']}: {s['error']}" for s in errors})[:10],
+        },
+        "latency_ms": _percentiles([s["latency"] for s in succeeded]),
+        "per_step": per_step,
+        "db_connections": {
+            "opened": counters["opened"],
+            "failed": counters["failed"],
+            "peak_concurrent": counters["peak"],
+            "left_open": counters["open"],
+            "per_session": counters["opened"] / len(sessions) if sessions else 0.0,
+        },
+        "memory_mb": {
+            "session_growth_avg": float(np.mean(rss_growth)) if rss_growth else None,
+            "session_growth_max": float(np.max(rss_growth)) if rss_growth else None,
+            "worker_peak_rss_max": float(np.max(peak_rss)) if peak_rss else None,
+        },
+    }
+
+
+def _format_latency(latency: Dict[str, float]) -> str:
+    if not latency:
+        return "aucune étape réussie"
+    return "  ".join(f"{k}={v:,.0f}" for k, v in latency.items())
+
+
+def print_report(report: Dict[str, Any]):
+    config = report["config"]
+    print(f"\n📊 Test de charge - {report['sessions']} session(s), "
+          f"concurrence {config['concurrency']}, scénario '{config['scenario']}'")
+    print(f"Durée totale        : {report['wall_time_s']:.1f} s")
+    print(f"Débit succès        : {report['throughput']['steps_per_s']:.2f} étapes/s, "
+          f"{report['throughput']['sessions_per_min']:.1f} sessions/min sans erreur")
+    print(f"Erreurs             : {report['errors']['count']} "
+          f"({report['errors']['rate']:.1%})")
+    print(f"Latence succès (ms) : {_format_latency(report['latency_ms'])}")
+
+    print("\nPar étape :")
+    for name, stats in report["per_step"].items():
+        print(f"  {name:<11} n={stats['count']:<4} erreurs={stats['errors']:<3} "
+              f"connexions/étape={stats['avg_connections']:.1f}  "
+              f"{_format_latency(stats['latency_ms'])}")
+
+    db = report["db_connections"]
+    print(f"\nConnexions MySQL    : {db['opened']} ouvertes, {db['failed']} échouées, "
+          f"pic simultané {db['peak_concurrent']}, {db['per_session']:.1f} par session, "
+          f"{db['left_open']} non fermées")
+
+    memory = report["memory_mb"]
+    if memory["session_growth_avg"] is not None:
+        print(f"Mémoire (Mo)        : +{memory['session_growth_avg']:.1f} RSS en moyenne par session "
+              f"(max +{memory['session_growth_max']:.1f}), hors imports (processus préchauffés), "
+              f"pic RSS processus {memory['worker_peak_rss_max']:.0f}")
+
+    for sample in report["errors"]["samples"]:
+        print(f"  ❌ {sample}")
+
+
+def check_thresholds(report: Dict[str, Any], max_p95_ms: Optional[float] = None,
+                     max_error_rate: Optional[float] = None) -> List[str]:
+    """Lister les seuils dépassés (liste vide si le test est réussi)"""
+    failures = []
+    if max_p95_ms is not None:
+        p95 = report["latency_ms"].get("p95")
+        if p95 is None:
+            failures.append("Latence p95 indisponible : aucune étape réussie")
+        elif p95 > max_p95_ms:
+            failures.append(f"Latence p95 {p95:,.0f} ms > seuil {max_p95_ms:,.0f} ms")
+    if max_error_rate is not None and report["errors"]["rate"] > max_error_rate:
+        failures.append(f"Taux d'erreur {report['errors']['rate']:.1%} > seuil {max_error_rate:.1%}")
+    return failures
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Test de charge de l'application Streamlit")
+    parser.add_argument("--sessions", type=int, default=10, help="Nombre de sessions simulées")
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="Nombre de sessions exécutées simultanément (processus)")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="lecture",
+                        help="'complet' ajoute, modifie et supprime des employés de test "
+                        "(nécessite --allow-writes)")
+    parser.add_argument("--steps", help="Liste d'étapes séparées par des virgules "
+                        f"(remplace le scénario) : {', '.join(STEPS)}")
+    parser.add_argument("--ramp-up", type=float, default=0.0,
+                        help="Durée (s) sur laquelle étaler le démarrage des sessions")
+    parser.add_argument("--think-time", type=float, default=0.0,
+                        help="Pause aléatoire maximale (s) entre deux étapes")
+    parser.add_argument("--timeout", type=float, default=30.0,
+                        help="Durée maximale (s) d'une exécution du script")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Fichier où écrire le rapport complet")
+    parser.add_argument("--allow-writes", action="store_true",
+                        help="Autoriser les étapes qui écrivent dans la base configurée")
+    parser.add_argument("--keep-data", action="store_true",
+                        help="Ne pas supprimer les employés de test restants")
+    parser.add_argument("--max-p95-ms", type=float,
+                        help="Échouer si la latence p95 dépasse ce seuil")
+    parser.add_argument("--max-error-rate", type=float,
+                        help="Échouer si le taux d'erreur dépasse ce seuil (0-1)")
+    args = parser.parse_args(argv)
+
+    if args.steps:
+        args.steps = [s.strip() for s in args.steps.split(",") if s.strip()]
+        unknown = [s for s in args.steps if s not in STEPS]
+        if unknown:
+            parser.error(f"Étapes inconnues : {', '.join(unknown)}")
+        if args.steps[0] != "ouvrir":
+            parser.error("La première étape doit être 'ouvrir'")
+        args.scenario = "personnalisé"
+    else:
+        args.steps = SCENARIOS[args.scenario]
+    writes = [s for s in args.steps if s in WRITE_STEPS]
+    if writes and not args.allow_writes:
+        parser.error(f"Les étapes {', '.join(writes)} écrivent dans la base : "
+                     "ajouter --allow-writes pour les exécuter")
+    if args.sessions < 1 or args.concurrency < 1:
+        parser.error("--sessions et --concurrency doivent être supérieurs à 0")
+    if args.ramp_up < 0 or args.think_time < 0:
+        parser.error("--ramp-up et --think-time ne peuvent pas être négatifs")
+    if args.timeout <= 0:
+        parser.error("--timeout doit être supérieur à 0")
+    if args.max_p95_ms is not None and args.max_p95_ms <= 0:
+        parser.error("--max-p95-ms doit être supérieur à 0")
+    if args.max_error_rate is not None and not 0 <= args.max_error_rate <= 1:
+        parser.error("--max-error-rate doit être compris entre 0 et 1 (ex. 0.05 pour 5 %)")
+    return args
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    run_id = uuid.uuid4().hex[:8]
+    config = {
+        "run_id": run_id,
+        "sessions": args.sessions,
+        "concurrency": args.concurrency,
+        "scenario": args.scenario,
+        "steps": args.steps,
+        "ramp_up": args.ramp_up,
+        "think_time": args.think_time,
+        "seed": args.seed,
+    }
+
+    ctx = mp.get_context("spawn")
+    lock = ctx.Lock()
+    counters = {name: ctx.Value("i", 0, lock=False) for name in ("opened", "failed", "open", "peak")}
+    ready = ctx.Value("d", 0.0, lock=False)
+    barrier = ctx.Barrier(args.concurrency)
+
+    jobs = [{
+        "run_id": run_id,
+        "index": i,
+        "seed": args.seed * 100003 + i,
+        "steps": args.steps,
+        "timeout": args.timeout,
+        "think_time": args.think_time,
+        "start_offset": args.ramp_up * i / args.sessions,
+    } for i in range(args.sessions)]
+
+    print(f"🚀 Lancement de {args.sessions} session(s) (run {run_id})...")
+    sessions = []
+    try:
+        with ctx.Pool(args.concurrency, initializer=_init_worker,
+                      initargs=(lock, counters["opened"], counters["failed"],
+                                counters["open"], counters["peak"], ready, barrier,
+                                args.timeout)) as pool:
+            for result in pool.imap_unordered(run_session, jobs):
+                sessions.append(result)
+                print(f"  session {result['index']} terminée en {result['duration']:.1f} s")
+    finally:
+        # Nettoyer même si le test est interrompu (Ctrl-C, processus en échec)
+        if not args.keep_data and any(name in args.steps for name in WRITE_STEPS):
+            try:
+                removed = cleanup_test_data(run_id)
+                if removed:
+                    print(f"🧹 {removed} employé(s) de test supprimé(s)")
+            except Exception as e:
+                print(f"⚠️ Nettoyage des données de test impossible : {str(e)}")
+
+    # Mesurer du début de la première session à la fin de la dernière : le
+    # démarrage et le préchauffage des processus ne sont pas de la charge
+    wall_time = (max(r["ended_at"] for r in sessions) - min(r["started_at"] for r in sessions)
+                 if sessions else 0.0)
+
+    report = build_report(sorted(sessions, key=lambda s: s["index"]), wall_time,
+                          {name: value.value for name, value in counters.items()}, config)
+    print_report(report)
+
+    if args.json:
+        report["session_details"] = sessions
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    failures = check_thresholds(report, args.max_p95_ms, args.max_error_rate)
+    for failure in failures:
+        print(f"\n❌ {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    # AppTest exécute app.py en tant que __main__ dans les processus de travail :
+    # passer par le module importé pour que run_session reste accessible
+    import load_test
+    sys.exit(load_test.main())
@@ -0,0 +1,128 @@
+"""Tests du calcul du rapport et des options de load_test.py (sans base ni session)"""
+import pytest
+
+pytest.importorskip("streamlit")
+pytest.importorskip("mysql.connector")
+
+import load_test
+
+
+def make_step(name, latency, error=None, connections=0):
+    return {"step": name, "latency": latency, "connections": connections, "error": error}
+
+
+def make_session(index, steps, rss_growth_mb=10.0):
+    return {"index": index, "steps": steps, "rss_growth_mb": rss_growth_mb, "peak_rss_mb": 150.0}
+
+
+COUNTERS = {"opened": 6, "failed": 1, "open": 0, "peak": 2}
+CONFIG = {"steps": ["ouvrir", "exporter"], "concurrency": 2, "scenario": "lecture"}
+
+
+def test_percentiles():
+    latencies = [i / 1000 for i in range(1, 101)]  # 1 à 100 ms
+    result = load_test._percentiles(latencies)
+    assert result["p50"] == pytest.approx(50.5)
+    assert result["p95"] == pytest.approx(95.05)
+    assert result["max"] == pytest.approx(100)
+    assert load_test._percentiles([]) == {}
+
+
+def test_build_report():
+    sessions = [
+        make_session(0, [make_step("ouvrir", 1.0, connections=1), make_step("exporter", 0.2)]),
+        make_session(1, [make_step("ouvrir", 3.0, connections=1),
+                         make_step("exporter", 0.001, error="LookupError")], rss_growth_mb=20.0),
+    ]
+    report = load_test.build_report(sessions, 2.0, COUNTERS, CONFIG)
+
+    assert report["steps"] == 4
+    # Seules les étapes réussies et les sessions sans erreur comptent dans le débit
+    assert report["throughput"]["steps_per_s"] == pytest.approx(1.5)
+    assert report["throughput"]["sessions_per_min"] == pytest.approx(30.0)
+    assert report["errors"]["count"] == 1
+    assert report["errors"]["rate"] == pytest.approx(0.25)
+    assert report["errors"]["samples"] == ["exporter: LookupError"]
+    # Les étapes en échec n'entrent pas dans les latences
+    assert report["latency_ms"]["max"] == pytest.approx(3000)
+    assert report["per_step"]["exporter"]["count"] == 2
+    assert report["per_step"]["exporter"]["errors"] == 1
+    assert report["per_step"]["exporter"]["latency_ms"]["max"] == pytest.approx(200)
+    assert report["per_step"]["ouvrir"]["avg_connections"] == pytest.approx(1.0)
+    assert report["db_connections"]["per_session"] == pytest.approx(3.0)
+    assert report["memory_mb"]["session_growth_avg"] == pytest.approx(15.0)
+    assert report["memory_mb"]["session_growth_max"] == pytest.approx(20.0)
+
+
+def test_build_report_reports_reload_separately():
+    sessions = [make_session(0, [make_step("ouvrir", 2.0, connections=1),
+                                 make_step("supprimer", 0.5, connections=2),
+                                 make_step("recharger", 0.4)])]
+    config = dict(CONFIG, steps=["ouvrir", "supprimer"])
+    report = load_test.build_report(sessions, 3.0, COUNTERS, config)
+
+    assert list(report["per_step"]) == ["ouvrir", "supprimer", "recharger"]
+    assert report["per_step"]["ouvrir"]["count"] == 1
+    assert report["per_step"]["ouvrir"]["avg_connections"] == pytest.approx(1.0)
+    assert report["per_step"]["recharger"]["latency_ms"]["max"] == pytest.approx(400)
+
+
+def test_build_report_all_failed():
+    sessions = [make_session(0, [make_step("ouvrir", 0.01, error="Erreur de connexion")])]
+    report = load_test.build_report(sessions, 1.0, COUNTERS, CONFIG)
+
+    assert report["latency_ms"] == {}
+    assert report["throughput"]["steps_per_s"] == 0.0
+    assert report["throughput"]["sessions_per_min"] == 0.0
+    assert report["errors"]["rate"] == 1.0
+    assert report["per_step"]["ouvrir"]["latency_ms"] == {}
+
+
+def test_check_thresholds():
+    report = {"latency_ms": {"p95": 1500.0}, "errors": {"rate": 0.02}}
+
+    assert load_test.check_thresholds(report) == []
+    assert load_test.check_thresholds(report, max_p95_ms=2000, max_error_rate=0.05) == []
+    assert len(load_test.check_thresholds(report, max_p95_ms=1000)) == 1
+    assert len(load_test.check_thresholds(report, max_error_rate=0.01)) == 1
+    assert len(load_test.check_thresholds(report, max_p95_ms=1000, max_error_rate=0.01)) == 2
+
+
+def test_check_thresholds_without_successful_step():
+    report = {"latency_ms": {}, "errors": {"rate": 1.0}}
+    assert len(load_test.check_thresholds(report, max_p95_ms=2000)) == 1
+
+
+def test_parse_args_defaults_to_read_only():
+    args = load_test.parse_args([])
+    assert args.scenario == "lecture"
+    assert not set(args.steps) & set(load_test.WRITE_STEPS)
+
+
+def test_parse_args_custom_steps():
+    args = load_test.parse_args(["--steps", "ouvrir, rechercher,exporter"])
+    assert args.steps == ["ouvrir", "rechercher", "exporter"]
+    assert args.scenario == "personnalisé"
+
+
+@pytest.mark.parametrize("argv", [
+    ["--steps", "ouvrir,inconnue"],
+    ["--steps", "rechercher,exporter"],
+    ["--scenario", "complet"],
+    ["--steps", "ouvrir,ajouter"],
+    ["--sessions", "0"],
+    ["--ramp-up", "-1"],
+    ["--think-time", "-0.5"],
+    ["--timeout", "0"],
+    ["--max-p95-ms", "-100"],
+    ["--max-error-rate", "5"],
+    ["--max-error-rate", "-0.1"],
+])
+def test_parse_args_rejects_invalid(argv):
+    with pytest.raises(SystemExit):
+        load_test.parse_args(argv)
+
+
+def test_parse_args_allows_writes_explicitly():
+    args = load_test.parse_args(["--scenario", "complet", "--allow-writes"])
+    assert "supprimer" in args.steps